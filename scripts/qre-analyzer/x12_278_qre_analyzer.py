@@ -11,13 +11,49 @@ This analyzer ensures compliance with:
 - Best practices for authorization inquiry transactions
 """
 
+import copy
+import functools
 import json
+import mmap
+import os
 import sys
-import re
-from typing import Dict, List, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
+from typing import BinaryIO, Callable, Dict, Generator, Iterable, Iterator, List, Set, Tuple, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the standard library encoder
+    orjson = None
+
+
+# Segment matching on the tokenizer/validator path uses bytes.find, split and
+# direct element comparisons (or str.startswith with a tuple of prefixes);
+# regular expressions are deliberately avoided here.
+
+# Read size used when streaming files that cannot be memory-mapped
+READ_CHUNK_SIZE = 64 * 1024
+
+# Files are tokenized as bytes and only the values that are reported are
+# decoded; invalid sequences are replaced rather than failing the file
+X12_ENCODING = 'utf-8'
+X12_DECODE_ERRORS = 'replace'
+
+# Expected element values (raw bytes, compared against tokenized elements)
+EXPECTED_ST_CODE = b'278'
+EXPECTED_ST_VERSION_SUFFIX = b'X215'
+EXPECTED_BHT01 = b'0007'
+HCR01_ACTION_CODES = frozenset({b'I1', b'A1', b'A2', b'A3', b'A4'})
+
+# Segment IDs whose first element is recorded as a qualifier for query
+# method detection (REF*D9, NM1*IL)
+QUALIFIED_SEGMENTS = frozenset({'REF', 'NM1'})
+
+# Slotted dataclasses drop the per-instance __dict__; slots=True needs Python 3.10+
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class Severity(Enum):
     """Validation severity levels"""
@@ -26,7 +62,7 @@ class Severity(Enum):
     INFO = "INFO"
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ValidationResult:
     """Validation result for a single check"""
     severity: Severity
@@ -34,10 +70,10 @@ class ValidationResult:
     message: str
     segment: Optional[str] = None
     line_number: Optional[int] = None
-    context: Dict = field(default_factory=dict)
+    context: Optional[Dict] = None
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class AnalysisReport:
     """Complete analysis report"""
     file_path: str
@@ -49,6 +85,31 @@ class AnalysisReport:
     results: List[ValidationResult]
     query_method: Optional[str] = None
     segments_found: List[str] = field(default_factory=list)
+    
+    @property
+    def results_by_severity(self) -> Dict[Severity, List[ValidationResult]]:
+        """Results grouped by severity (ERROR, WARNING, INFO)"""
+        return _group_by_severity(self.results)
+
+
+def _group_by_severity(results: List[ValidationResult]) -> Dict[Severity, List[ValidationResult]]:
+    """Bucket results by severity in a single pass, preserving order"""
+    buckets: Dict[Severity, List[ValidationResult]] = {s: [] for s in Severity}
+    for r in results:
+        buckets[r.severity].append(r)
+    return buckets
+
+
+@functools.lru_cache(maxsize=16)
+def _read_config(abs_config_path: str) -> Dict:
+    """Parse a configuration file once per absolute path (never handed out)"""
+    with open(abs_config_path, 'r') as f:
+        return json.load(f)
+
+
+def _load_config(config_path: str) -> Dict:
+    """Load analyzer configuration as a private copy of the cached parse"""
+    return copy.deepcopy(_read_config(os.path.abspath(config_path)))
 
 
 class X12_278_QRE_Analyzer:
@@ -58,213 +119,347 @@ class X12_278_QRE_Analyzer:
     Validates X12 278 inquiry transactions against QRE requirements.
     """
     
+    # Segment ID -> element check run on its first occurrence (results held until validation)
+    _SEG_HANDLERS = {
+        'ST': '_check_st',
+        'BHT': '_check_bht',
+        'HCR': '_check_hcr',
+    }
+    
     def __init__(self, config_path: str = "qre-analyzer.config.json"):
         """Initialize analyzer with configuration"""
-        with open(config_path, 'r') as f:
-            self.config = json.load(f)
+        self.config = _load_config(config_path)
+        
+        # Config is fixed for the analyzer's lifetime; resolve the settings
+        # consulted on every file once
+        self._validate_envelopes_enabled = self.config['validationRules']['validateEnvelopes']
+        self._minimal_data = self.config['qreRequirements']['minimalDataPrinciple']
+        self._required_segments = tuple(self.config['qreRequirements']['requiredSegments'])
+        self._fail_on_warnings = self.config['errorHandling']['failOnWarnings']
+        self._tr3_version = self.config['tr3Version']
+        
+        # Specialize the validation pipeline for this config: disabled checks
+        # are left out here instead of being skipped on every file
+        self._pipeline: List[Callable[[], Iterator[ValidationResult]]] = []
+        if self._validate_envelopes_enabled:
+            self._pipeline.append(self._validate_envelopes)
+        self._pipeline.append(self._validate_required_segments)
+        if self._minimal_data:
+            self._pipeline.append(self._validate_qre_requirements)
+        self._pipeline.append(self._detect_query_method)
+        
+        handler_enabled = {
+            'ST': self._validate_envelopes_enabled,
+            'BHT': self._minimal_data,
+            'HCR': self._minimal_data,
+        }
+        self._segment_handlers = {
+            seg_id: getattr(self, name) for seg_id, name in self._SEG_HANDLERS.items()
+            if handler_enabled.get(seg_id, True)
+        }
+        
+        # Print an 'Analyzing ...' line per file (batch workers turn this off)
+        self.show_progress = True
         
         self.results: List[ValidationResult] = []
         self.segments_found: List[str] = []
+        # Counts cover segments carrying elements ('ID*...'); IDs seen only
+        # bare still satisfy required segments
+        self.segment_counts: Dict[str, int] = {}
+        self.bare_segments: Set[str] = set()
+        self.qualified: Set[Tuple[str, bytes]] = set()
+        self.query_method: Optional[str] = None
+        self._segment_ids: Dict[bytes, str] = {}
+        self._segment_results: Dict[str, List[ValidationResult]] = {}
         
-    def analyze_file(self, file_path: str) -> AnalysisReport:
-        """Analyze an X12 278 EDI file"""
-        print(f"Analyzing X12 278 file: {file_path}")
+    def analyze_file(self, file_path: str, fast_fail: bool = False) -> AnalysisReport:
+        """Analyze an X12 278 EDI file
         
-        try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-        except Exception as e:
-            return self._create_error_report(file_path, f"Failed to read file: {str(e)}")
+        With fast_fail, analysis stops at the first result that makes the file
+        invalid (an ERROR, or a WARNING when failOnWarnings is set).
+        """
+        if self.show_progress:
+            print(f"Analyzing X12 278 file: {file_path}")
         
         # Parse X12 content
         self.results = []
         self.segments_found = []
+        self.segment_counts = {}
+        self.bare_segments = set()
+        self.qualified = set()
+        self.query_method = None
+        self._segment_ids = {}
+        self._segment_results = {}
         
-        # Split by segment terminator
-        segments = content.split('~')
-        segments = [s.strip() for s in segments if s.strip()]
-        
-        # Extract segment identifiers
-        for segment in segments:
-            if segment:
-                seg_id = segment.split('*')[0]
+        # Stream the file once, counting segments per identifier, recording
+        # (segment ID, first element) pairs for qualifier lookups and
+        # dispatching the first occurrence of each segment to its element
+        # checks; element lists are not kept once a segment is processed
+        segment_counts = self.segment_counts
+        try:
+            for seg_id, elements in self._iter_segments(file_path):
                 self.segments_found.append(seg_id)
+                if len(elements) == 1:
+                    self.bare_segments.add(seg_id)
+                    continue
+                # A qualifier counts only when followed by a value ('REF*D9*<id>')
+                if seg_id in QUALIFIED_SEGMENTS and len(elements) > 2:
+                    self.qualified.add((seg_id, elements[1]))
+                count = segment_counts.get(seg_id, 0)
+                segment_counts[seg_id] = count + 1
+                if count == 0:
+                    handler = self._segment_handlers.get(seg_id)
+                    if handler:
+                        held = self._segment_results[seg_id] = list(handler(elements))
+                        if fast_fail and any(self._is_failing(r) for r in held):
+                            # Stop reading; report the held results in validator order
+                            self._collect(chain.from_iterable(
+                                self._segment_results.get(s, ()) for s in self._SEG_HANDLERS
+                            ), fast_fail)
+                            return self._generate_report(file_path)
+        except OSError as e:
+            return self._create_error_report(file_path, f"Failed to read file: {str(e)}")
         
         # Run validations
-        self._validate_envelopes(segments)
-        self._validate_required_segments()
-        self._validate_qre_requirements(segments)
-        self._detect_query_method(segments)
+        self._collect(chain.from_iterable(v() for v in self._pipeline), fast_fail)
         
         # Generate report
         return self._generate_report(file_path)
     
-    def _validate_envelopes(self, segments: List[str]):
-        """Validate ISA/GS/ST/SE/GE/IEA envelopes"""
-        if not self.config['validationRules']['validateEnvelopes']:
-            return
+    def _is_failing(self, result: ValidationResult) -> bool:
+        """Whether a result makes the file invalid under the current config"""
+        return (result.severity is Severity.ERROR or
+                (self._fail_on_warnings and result.severity is Severity.WARNING))
+    
+    def _collect(self, results: Iterable[ValidationResult], fast_fail: bool):
+        """Append results, stopping after the first failing one when fast_fail is set"""
+        for result in results:
+            self.results.append(result)
+            if fast_fail and self._is_failing(result):
+                return
+    
+    def _iter_segments(self, file_path: str) -> Iterator[Tuple[str, List[bytes]]]:
+        """Yield (segment ID, raw elements) for each segment in the file
         
+        Regular files are memory-mapped and scanned in place, so the file is
+        never copied into a Python object; empty and non-mappable files (pipes)
+        are read in chunks instead.
+        """
+        with open(file_path, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                yield from self._iter_chunked_segments(f)
+                return
+            with mm:
+                pos = yield from self._scan_segments(mm)
+                # Terminate a trailing segment so it takes the same split path
+                yield from self._scan_segments(mm[pos:] + b'~')
+    
+    def _iter_chunked_segments(self, f: BinaryIO) -> Iterator[Tuple[str, List[bytes]]]:
+        """Yield (segment ID, raw elements) for each segment, reading f in chunks"""
+        buf = bytearray()
+        while True:
+            chunk = f.read(READ_CHUNK_SIZE)
+            if not chunk:
+                if not buf:
+                    break
+                # Terminate a trailing segment so it takes the same split path
+                chunk = b'~'
+            # The carried remainder holds no terminator; only search the new bytes
+            search_from = len(buf)
+            buf += chunk
+            pos = yield from self._scan_segments(buf, search_from)
+            # Keep only the unterminated remainder for the next chunk
+            del buf[:pos]
+    
+    def _scan_segments(self, buf, search_from: int = 0) -> Generator[Tuple[str, List[bytes]], None, int]:
+        """Yield each terminated segment in buf, returning the offset past the last one
+        
+        Each segment is split on the element separator exactly once; the
+        element lists are what the segment handlers consume. Segment IDs are
+        decoded once per file and cached, so the thousands of repeats of the
+        few dozen distinct IDs share one string object and cached hash.
+        """
+        segment_ids = self._segment_ids
+        pos = 0
+        term = buf.find(b'~', search_from)
+        while term != -1:
+            # bytes() is a no-op for mmap slices and copies bytearray slices
+            segment = bytes(buf[pos:term]).strip()
+            if segment:
+                elements = segment.split(b'*')
+                seg_id = segment_ids.get(elements[0])
+                if seg_id is None:
+                    seg_id = segment_ids[elements[0]] = elements[0].decode(X12_ENCODING, X12_DECODE_ERRORS)
+                yield seg_id, elements
+            pos = term + 1
+            term = buf.find(b'~', pos)
+        return pos
+    
+    def _validate_envelopes(self) -> Iterator[ValidationResult]:
+        """Validate ISA/GS/ST/SE/GE/IEA envelopes"""
         # Check ISA
-        isa_segments = [s for s in segments if s.startswith('ISA*')]
-        if len(isa_segments) == 0:
-            self.results.append(ValidationResult(
+        isa_count = self.segment_counts.get('ISA', 0)
+        if isa_count == 0:
+            yield ValidationResult(
                 severity=Severity.ERROR,
                 code="ENV001",
                 message="Missing ISA segment (Interchange Control Header)",
                 segment="ISA"
-            ))
-        elif len(isa_segments) > 1:
-            self.results.append(ValidationResult(
+            )
+        elif isa_count > 1:
+            yield ValidationResult(
                 severity=Severity.WARNING,
                 code="ENV002",
-                message=f"Multiple ISA segments found ({len(isa_segments)})",
+                message=f"Multiple ISA segments found ({isa_count})",
                 segment="ISA"
-            ))
+            )
         
         # Check GS
-        gs_segments = [s for s in segments if s.startswith('GS*')]
-        if len(gs_segments) == 0:
-            self.results.append(ValidationResult(
+        if 'GS' not in self.segment_counts:
+            yield ValidationResult(
                 severity=Severity.ERROR,
                 code="ENV003",
                 message="Missing GS segment (Functional Group Header)",
                 segment="GS"
-            ))
+            )
         
-        # Check ST - must have transaction code 278
-        st_segments = [s for s in segments if s.startswith('ST*')]
-        if len(st_segments) == 0:
-            self.results.append(ValidationResult(
+        # Check ST - the first ST's transaction code was checked by _check_st
+        if 'ST' not in self.segment_counts:
+            yield ValidationResult(
                 severity=Severity.ERROR,
                 code="ENV004",
                 message="Missing ST segment (Transaction Set Header)",
                 segment="ST"
-            ))
+            )
         else:
-            st_elements = st_segments[0].split('*')
-            if len(st_elements) >= 2 and st_elements[1] != '278':
-                self.results.append(ValidationResult(
-                    severity=Severity.ERROR,
-                    code="ENV005",
-                    message=f"Invalid transaction code: expected '278', found '{st_elements[1]}'",
-                    segment="ST"
-                ))
-            if len(st_elements) >= 4 and not st_elements[3].endswith('X215'):
-                self.results.append(ValidationResult(
-                    severity=Severity.WARNING,
-                    code="ENV006",
-                    message=f"Implementation guide version '{st_elements[3]}' may not be 005010X215",
-                    segment="ST",
-                    context={"version": st_elements[3]}
-                ))
+            yield from self._segment_results.get('ST', ())
     
-    def _validate_required_segments(self):
+    def _validate_required_segments(self) -> Iterator[ValidationResult]:
         """Validate required X12 segments per QRE"""
-        required = self.config['qreRequirements']['requiredSegments']
-        
-        for seg_id in required:
-            if seg_id not in self.segments_found:
-                self.results.append(ValidationResult(
+        for seg_id in self._required_segments:
+            if seg_id not in self.segment_counts and seg_id not in self.bare_segments:
+                yield ValidationResult(
                     severity=Severity.ERROR,
                     code="QRE001",
                     message=f"Missing required segment: {seg_id}",
                     segment=seg_id
-                ))
+                )
     
-    def _validate_qre_requirements(self, segments: List[str]):
+    def _validate_qre_requirements(self) -> Iterator[ValidationResult]:
         """Validate QRE-specific requirements (minimal data principle)"""
-        if not self.config['qreRequirements']['minimalDataPrinciple']:
-            return
-        
-        # Check for BHT segment with correct hierarchy code
-        bht_segments = [s for s in segments if s.startswith('BHT*')]
-        if bht_segments:
-            bht_elements = bht_segments[0].split('*')
-            if len(bht_elements) >= 2:
-                if bht_elements[1] != '0007':
-                    self.results.append(ValidationResult(
-                        severity=Severity.WARNING,
-                        code="QRE002",
-                        message=f"BHT01 should be '0007' for inquiry, found '{bht_elements[1]}'",
-                        segment="BHT",
-                        context={"bht01": bht_elements[1]}
-                    ))
+        # BHT hierarchy code (checked by _check_bht on the first BHT)
+        yield from self._segment_results.get('BHT', ())
         
         # Check for UM segment (service type)
-        um_segments = [s for s in segments if s.startswith('UM*')]
-        if not um_segments:
-            self.results.append(ValidationResult(
+        if 'UM' not in self.segment_counts:
+            yield ValidationResult(
                 severity=Severity.WARNING,
                 code="QRE003",
                 message="UM segment (Health Care Services Review Information) is recommended for QRE",
                 segment="UM"
-            ))
+            )
         
-        # Check for HCR segment (request for service type)
-        hcr_segments = [s for s in segments if s.startswith('HCR*')]
-        if hcr_segments:
-            hcr_elements = hcr_segments[0].split('*')
-            if len(hcr_elements) >= 2:
-                # HCR01 should be 'I1' for inquiry
-                if hcr_elements[1] not in ['I1', 'A1', 'A2', 'A3', 'A4']:
-                    self.results.append(ValidationResult(
-                        severity=Severity.INFO,
-                        code="QRE004",
-                        message=f"HCR01 action code is '{hcr_elements[1]}' (I1=Inquiry is recommended)",
-                        segment="HCR",
-                        context={"hcr01": hcr_elements[1]}
-                    ))
+        # HCR action code (checked by _check_hcr on the first HCR)
+        yield from self._segment_results.get('HCR', ())
+    
+    def _check_st(self, elements: List[bytes]) -> Iterator[ValidationResult]:
+        """Check ST transaction code (must be 278) and implementation guide version"""
+        if len(elements) >= 2 and elements[1] != EXPECTED_ST_CODE:
+            st01 = elements[1].decode(X12_ENCODING, X12_DECODE_ERRORS)
+            yield ValidationResult(
+                severity=Severity.ERROR,
+                code="ENV005",
+                message=f"Invalid transaction code: expected '{EXPECTED_ST_CODE.decode()}', found '{st01}'",
+                segment="ST"
+            )
+        if len(elements) >= 4 and not elements[3].endswith(EXPECTED_ST_VERSION_SUFFIX):
+            st03 = elements[3].decode(X12_ENCODING, X12_DECODE_ERRORS)
+            yield ValidationResult(
+                severity=Severity.WARNING,
+                code="ENV006",
+                message=f"Implementation guide version '{st03}' may not be 005010X215",
+                segment="ST",
+                context={"version": st03}
+            )
+    
+    def _check_bht(self, elements: List[bytes]) -> Iterator[ValidationResult]:
+        """Check BHT segment for the inquiry hierarchy code"""
+        if len(elements) >= 2 and elements[1] != EXPECTED_BHT01:
+            bht01 = elements[1].decode(X12_ENCODING, X12_DECODE_ERRORS)
+            yield ValidationResult(
+                severity=Severity.WARNING,
+                code="QRE002",
+                message=f"BHT01 should be '{EXPECTED_BHT01.decode()}' for inquiry, found '{bht01}'",
+                segment="BHT",
+                context={"bht01": bht01}
+            )
     
-    def _detect_query_method(self, segments: List[str]):
+    def _check_hcr(self, elements: List[bytes]) -> Iterator[ValidationResult]:
+        """Check HCR segment (request for service type) action code"""
+        # HCR01 should be 'I1' for inquiry
+        if len(elements) >= 2 and elements[1] not in HCR01_ACTION_CODES:
+            hcr01 = elements[1].decode(X12_ENCODING, X12_DECODE_ERRORS)
+            yield ValidationResult(
+                severity=Severity.INFO,
+                code="QRE004",
+                message=f"HCR01 action code is '{hcr01}' (I1=Inquiry is recommended)",
+                segment="HCR",
+                context={"hcr01": hcr01}
+            )
+    
+    def _detect_query_method(self) -> Iterator[ValidationResult]:
         """Detect query method (by auth number or member demographics)"""
-        has_ref_auth = any(s.startswith('REF*D9*') for s in segments)
-        has_member_id = any(s.startswith('NM1*IL*') for s in segments)
-        has_dob = any(s.startswith('DMG*') for s in segments)
+        has_ref_auth = ('REF', b'D9') in self.qualified
+        has_member_id = ('NM1', b'IL') in self.qualified
+        has_dob = 'DMG' in self.segment_counts
         
         if has_ref_auth:
             self.query_method = "ByAuthorizationNumber"
-            self.results.append(ValidationResult(
+            yield ValidationResult(
                 severity=Severity.INFO,
                 code="QRE005",
                 message="Query method: Authorization Number (REF*D9 segment found)",
                 segment="REF"
-            ))
+            )
         elif has_member_id and has_dob:
             self.query_method = "ByMemberDemographics"
-            self.results.append(ValidationResult(
+            yield ValidationResult(
                 severity=Severity.INFO,
                 code="QRE006",
                 message="Query method: Member Demographics (NM1*IL and DMG segments found)",
                 segment="NM1"
-            ))
+            )
         else:
             self.query_method = "Unknown"
-            self.results.append(ValidationResult(
+            yield ValidationResult(
                 severity=Severity.WARNING,
                 code="QRE007",
                 message="Cannot determine query method (need REF*D9 OR (NM1*IL + DMG))",
                 segment="REF"
-            ))
+            )
     
     def _generate_report(self, file_path: str) -> AnalysisReport:
         """Generate analysis report"""
-        error_count = sum(1 for r in self.results if r.severity == Severity.ERROR)
-        warning_count = sum(1 for r in self.results if r.severity == Severity.WARNING)
-        info_count = sum(1 for r in self.results if r.severity == Severity.INFO)
+        buckets = _group_by_severity(self.results)
+        error_count = len(buckets[Severity.ERROR])
+        warning_count = len(buckets[Severity.WARNING])
+        info_count = len(buckets[Severity.INFO])
         
         is_valid = error_count == 0
-        if self.config['errorHandling']['failOnWarnings']:
+        if self._fail_on_warnings:
             is_valid = is_valid and warning_count == 0
         
         return AnalysisReport(
             file_path=file_path,
-            tr3_version=self.config['tr3Version'],
+            tr3_version=self._tr3_version,
             is_valid=is_valid,
             error_count=error_count,
             warning_count=warning_count,
             info_count=info_count,
             results=self.results,
-            query_method=getattr(self, 'query_method', None),
+            query_method=self.query_method,
             segments_found=self.segments_found
         )
     
@@ -272,7 +467,7 @@ class X12_278_QRE_Analyzer:
         """Create error report for file read failures"""
         return AnalysisReport(
             file_path=file_path,
-            tr3_version=self.config['tr3Version'],
+            tr3_version=self._tr3_version,
             is_valid=False,
             error_count=1,
             warning_count=0,
@@ -287,32 +482,37 @@ class X12_278_QRE_Analyzer:
     
     def print_report(self, report: AnalysisReport):
         """Print analysis report to console"""
-        print("\n" + "="*80)
-        print(f"X12 278 X215 QRE Analysis Report")
-        print("="*80)
-        print(f"File: {report.file_path}")
-        print(f"TR3 Version: {report.tr3_version}")
-        print(f"Valid: {'✓ YES' if report.is_valid else '✗ NO'}")
-        print(f"Errors: {report.error_count}")
-        print(f"Warnings: {report.warning_count}")
-        print(f"Info: {report.info_count}")
+        lines = [
+            "",
+            "="*80,
+            "X12 278 X215 QRE Analysis Report",
+            "="*80,
+            f"File: {report.file_path}",
+            f"TR3 Version: {report.tr3_version}",
+            f"Valid: {'✓ YES' if report.is_valid else '✗ NO'}",
+            f"Errors: {report.error_count}",
+            f"Warnings: {report.warning_count}",
+            f"Info: {report.info_count}",
+        ]
         if report.query_method:
-            print(f"Query Method: {report.query_method}")
-        print(f"Segments Found: {len(report.segments_found)}")
-        print("-"*80)
+            lines.append(f"Query Method: {report.query_method}")
+        lines.append(f"Segments Found: {len(report.segments_found)}")
+        lines.append("-"*80)
         
-        # Group results by severity
-        for severity in [Severity.ERROR, Severity.WARNING, Severity.INFO]:
-            severity_results = [r for r in report.results if r.severity == severity]
+        # Group results by severity in a single pass
+        for severity, severity_results in report.results_by_severity.items():
             if severity_results:
-                print(f"\n{severity.value}S ({len(severity_results)}):")
+                lines.append(f"\n{severity.value}S ({len(severity_results)}):")
                 for result in severity_results:
                     seg_info = f" [{result.segment}]" if result.segment else ""
-                    print(f"  {result.code}{seg_info}: {result.message}")
+                    lines.append(f"  {result.code}{seg_info}: {result.message}")
                     if result.context:
-                        print(f"    Context: {result.context}")
+                        lines.append(f"    Context: {result.context}")
         
-        print("\n" + "="*80)
+        lines.append("\n" + "="*80)
+        
+        # Emit the whole report with a single write
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def export_report_json(self, report: AnalysisReport, output_path: Optional[str] = None):
         """Export report as JSON"""
@@ -332,18 +532,57 @@ class X12_278_QRE_Analyzer:
                     "message": r.message,
                     "segment": r.segment,
                     "line_number": r.line_number,
-                    "context": r.context
+                    "context": r.context or {}
                 }
                 for r in report.results
             ]
         }
         
+        if orjson is not None:
+            report_json = orjson.dumps(report_dict, option=orjson.OPT_INDENT_2)
+        else:
+            # Match orjson's output: raw UTF-8 rather than \u escapes
+            report_json = json.dumps(report_dict, indent=2, ensure_ascii=False).encode('utf-8')
+        
         if output_path:
-            with open(output_path, 'w') as f:
-                json.dump(report_dict, f, indent=2)
+            with open(output_path, 'wb') as f:
+                f.write(report_json)
             print(f"\nReport exported to: {output_path}")
         else:
-            print(json.dumps(report_dict, indent=2))
+            print(report_json.decode('utf-8'))
+
+
+# Analyzer owned by each batch_analyze worker process
+_worker_analyzer: Optional[X12_278_QRE_Analyzer] = None
+
+
+def _init_batch_worker(config_path: str):
+    """Create the per-process analyzer for batch_analyze workers"""
+    global _worker_analyzer
+    _worker_analyzer = X12_278_QRE_Analyzer(config_path)
+    # Per-file progress lines from parallel workers would interleave
+    _worker_analyzer.show_progress = False
+
+
+def _analyze_in_worker(file_path: str, fast_fail: bool) -> AnalysisReport:
+    """Analyze one file with the worker's analyzer"""
+    return _worker_analyzer.analyze_file(file_path, fast_fail)
+
+
+def batch_analyze(paths: List[str], config_path: str = "qre-analyzer.config.json",
+                  max_workers: Optional[int] = None, fast_fail: bool = False) -> List[AnalysisReport]:
+    """Analyze many X12 278 files in parallel across processes
+    
+    Each worker process loads the configuration once and reuses its analyzer
+    for every file it is handed; workers do not print per-file progress.
+    Reports are returned in the order of paths. Under the 'spawn' start
+    method (the default on macOS and Windows) call this from behind an
+    ``if __name__ == "__main__":`` guard.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             initializer=_init_batch_worker,
+                             initargs=(config_path,)) as executor:
+        return list(executor.map(_analyze_in_worker, paths, repeat(fast_fail)))
 
 
 def main():